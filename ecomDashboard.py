@@ -1,9 +1,15 @@
+import os
+import json
+import tempfile
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
 import numpy as np
+from numba import njit
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
 
 # Custom color palette and theme for consistent visualization
 plotly_template = {
@@ -29,6 +35,40 @@ plotly_template = {
 custom_colors = ['#7289da', '#43b581', '#faa61a', '#f04747', '#b9bbbe',
                 '#00b0f4', '#8ea1e1', '#eb459e', '#2ecc71', '#e91e63']
 
+# Longest daily series the trend charts plot before switching to weekly totals
+max_trend_points = 500
+
+# Bar, pie and line charts built straight from already aggregated arrays
+def bar_chart(x, y, title, x_label, y_label, color=custom_colors[0]):
+    fig = go.Figure(go.Bar(x=np.asarray(x), y=np.asarray(y), marker_color=color))
+    fig.update_layout(
+        title=title,
+        xaxis_title=x_label,
+        yaxis_title=y_label,
+        template=plotly_template
+    )
+    return fig
+
+# piecolorway (as px.pie sets it) cycles the palette for pies with more slices
+# than colours
+def pie_chart(labels, values, title):
+    fig = go.Figure(go.Pie(labels=np.asarray(labels), values=np.asarray(values)))
+    fig.update_layout(title=title, template=plotly_template, piecolorway=custom_colors)
+    return fig
+
+# A fixed uirevision lets Plotly.js update the figure in place and keep the
+# user's zoom and legend state across reruns
+def line_chart(x, y, title, x_label, y_label, uirevision=None):
+    fig = go.Figure(go.Scatter(x=np.asarray(x), y=np.asarray(y), mode='lines', line_color=custom_colors[0]))
+    fig.update_layout(
+        title=title,
+        xaxis_title=x_label,
+        yaxis_title=y_label,
+        template=plotly_template,
+        uirevision=uirevision
+    )
+    return fig
+
 # Get current time for greeting
 current_time = datetime.now()
 hour = current_time.hour
@@ -69,44 +109,525 @@ st.markdown(f"""
 # Add a visual separator
 st.markdown("---")
 
+# Source CSV and the cleaned Parquet copy written after the first load
+csv_path = "data/Amazon Sale Report.csv"
+parquet_path = "data/amazon_sale_report.parquet"
+
+# Stored in the Parquet metadata; bump whenever the cleaning in load_data changes
+# so sidecars written by older code are rebuilt from the CSV
+cleaning_version = '4'
+
+# Columns referenced anywhere in the dashboard
+dashboard_columns = ['Date', 'Amount', 'Qty', 'Order ID', 'Category', 'ship-state',
+                     'ship-city', 'Status', 'fulfilled-by', 'ship-service-level',
+                     'B2B', 'promotion-ids', 'ship-postal-code']
+
+# Repeated string columns stored as categoricals so groupbys and distinct
+# counts work on integer codes
+categorical_columns = ['Order ID', 'Category', 'ship-state', 'ship-city', 'Status', 'fulfilled-by',
+                       'ship-service-level', 'promotion-ids', 'ship-postal-code']
+
+# Map Arrow types to pandas dtypes: dictionary columns become Categoricals,
+# timestamps stay numpy datetime64 so the .dt accessors keep working, and
+# numeric columns stay numpy so the sidecar returns the float32/int16 columns
+# the CSV cleaning produced
+def to_pandas_dtype(arrow_type):
+    if (pa.types.is_dictionary(arrow_type) or pa.types.is_timestamp(arrow_type)
+            or pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)):
+        return None
+    return pd.ArrowDtype(arrow_type)
+
+# Column dtypes of the cleaned frame, stored in the sidecar metadata so a warm
+# load can confirm it reproduces exactly what the CSV path returned
+def dtype_signature(df):
+    return json.dumps(df.dtypes.astype(str).to_dict()).encode()
+
+# Whether the Parquet sidecar was written by the current cleaning code and is
+# not older than the CSV (a sidecar deployed without the CSV is trusted as is);
+# an unreadable sidecar counts as stale so the CSV path rebuilds it
+def sidecar_is_current():
+    if not os.path.exists(parquet_path):
+        return False
+    try:
+        metadata = pq.read_schema(parquet_path).metadata or {}
+    except (OSError, pa.ArrowException):
+        return False
+    if metadata.get(b'cleaning_version') != cleaning_version.encode():
+        return False
+    return (not os.path.exists(csv_path)
+            or os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path))
+
 # Function to load and clean data
-@st.cache_data
+# (cache_resource shares one frame across reruns instead of unpickling a copy;
+# callers must treat it as read-only)
+@st.cache_resource
 def load_data():
     try:
-        # Read CSV with low_memory=False to handle mixed types
-        df = pd.read_csv("data/Amazon Sale Report.csv", low_memory=False)
+        # Use the cleaned Parquet copy when it is still current
+        if sidecar_is_current():
+            table = pq.read_table(parquet_path, columns=dashboard_columns)
+            df = table.to_pandas(types_mapper=to_pandas_dtype, ignore_metadata=True)
+            # Fall back to rebuilding from the CSV if the dtypes do not round-trip
+            if (table.schema.metadata or {}).get(b'dtypes') == dtype_signature(df):
+                return df
+        
+        # Read CSV with PyArrow's multithreaded reader using an explicit schema,
+        # parsing only the columns the dashboard uses
+        low_card = pa.dictionary(pa.int32(), pa.string())
+        table = pv.read_csv(
+            csv_path,
+            read_options=pv.ReadOptions(block_size=8 << 20, use_threads=True),
+            convert_options=pv.ConvertOptions(
+                include_columns=dashboard_columns,
+                column_types={
+                    'Date': pa.string(),
+                    'Order ID': pa.string(),
+                    'Amount': pa.float64(),
+                    'Qty': pa.int32(),
+                    'Category': low_card,
+                    'Status': low_card,
+                    'fulfilled-by': low_card,
+                    'ship-service-level': low_card,
+                    'ship-state': low_card,
+                    'ship-city': low_card,
+                    'ship-postal-code': pa.string(),
+                    'promotion-ids': pa.string(),
+                    'B2B': pa.bool_()
+                },
+                null_values=['', 'nan', 'NaN'],
+                strings_can_be_null=True
+            )
+        )
+        df = table.to_pandas(types_mapper=to_pandas_dtype)
         
         # Create a copy to avoid SettingWithCopyWarning
         df = df.copy()
         
-        # First, ensure the Date column contains string values
-        df['Date'] = df['Date'].astype(str)
-        
-        # Convert Date with explicit format (adjust format string if needed)
-        df['Date'] = pd.to_datetime(df['Date'], format='%m-%d-%y', errors='coerce')
+        # Convert Date with explicit format (adjust format string if needed);
+        # cache=True parses each distinct date string once
+        df['Date'] = pd.to_datetime(df['Date'], format='%m-%d-%y', errors='coerce', cache=True)
         
         # Drop any rows where Date conversion failed
         df = df.dropna(subset=['Date'])
         
         # Convert numeric columns
-        df['Amount'] = pd.to_numeric(df['Amount'], errors='coerce')
-        df['Qty'] = pd.to_numeric(df['Qty'], errors='coerce')
+        df['Amount'] = pd.to_numeric(df['Amount'], errors='coerce').astype('float32')
+        df['Qty'] = pd.to_numeric(df['Qty'], errors='coerce').fillna(0).astype('int16')
         
         # Fill missing values using proper pandas methods
-        df = df.assign(**{
-            'ship-postal-code': df['ship-postal-code'].astype(str).replace('nan', 'Unknown'),
-            'promotion-ids': df['promotion-ids'].fillna('No Promotion')
-        })
+        df['ship-postal-code'] = df['ship-postal-code'].fillna('Unknown')
+        df['promotion-ids'] = df['promotion-ids'].fillna('No Promotion')
+        
+        # Store repeated string values as categoricals; categories are sorted so
+        # grouped output keeps alphabetical order (Arrow dictionaries follow first appearance)
+        for col in categorical_columns:
+            df[col] = df[col].astype('category')
+            df[col] = df[col].cat.set_categories(sorted(df[col].cat.categories))
+        
+        # Sort by date so date ranges can be sliced from a sorted index
+        df = df.sort_values('Date', kind='stable')
         
-        return df
+        # Persist the cleaned data so later cold starts skip CSV parsing. It is
+        # written to a temp file and renamed into place, so a killed process or
+        # two sessions loading at once never leave a truncated sidecar behind
+        tmp_path = None
+        try:
+            table = pa.Table.from_pandas(df[dashboard_columns], preserve_index=False)
+            table = table.replace_schema_metadata({
+                **(table.schema.metadata or {}),
+                b'cleaning_version': cleaning_version.encode(),
+                b'dtypes': dtype_signature(df[dashboard_columns])
+            })
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(parquet_path), suffix='.tmp')
+            os.close(fd)
+            pq.write_table(table, tmp_path, compression='zstd')
+            os.replace(tmp_path, parquet_path)
+            tmp_path = None
+        except OSError:
+            # A read-only data directory just means every cold start parses the CSV
+            pass
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        
+        return df.reset_index(drop=True)
     
     except Exception as e:
         st.error(f"Error in data loading: {str(e)}")
         raise e
 
+# Apply the sidebar filters to the loaded data (shared and read-only, like load_data)
+@st.cache_resource(max_entries=32, ttl=3600)
+def get_filtered(filters):
+    date_range, selected_category, selected_region = filters
+    df = load_data()
+
+    # Binary-search the sorted datetime64 dates for the range (end date inclusive)
+    start = np.datetime64(date_range[0], 'D')
+    end = np.datetime64(date_range[1], 'D') + np.timedelta64(1, 'D')
+    lo, hi = np.searchsorted(df['Date'].to_numpy(), [start, end])
+    filtered_df = df.iloc[lo:hi]
+
+    # Combine the category and region filters into one mask over categorical
+    # codes so the slice is indexed (and copied) once
+    mask = np.ones(len(filtered_df), dtype=bool)
+    if selected_category != 'All':
+        category = filtered_df['Category'].cat
+        mask &= category.codes.to_numpy() == category.categories.get_loc(selected_category)
+    if selected_region != 'All':
+        region = filtered_df['ship-state'].cat
+        mask &= region.codes.to_numpy() == region.categories.get_loc(selected_region)
+    if not mask.all():
+        filtered_df = filtered_df.iloc[np.flatnonzero(mask)]
+
+    # Amount is stored as float32; widen (and snap back to whole cents) so sums
+    # over the selection keep cent precision
+    return filtered_df.assign(Amount=filtered_df['Amount'].astype('float64').round(2))
+
+# Row counts per category of a categorical column via np.bincount on its codes,
+# ordered like value_counts and without the categories that do not occur
+def category_counts(column):
+    codes = column.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(column.cat.categories))
+    dist = pd.Series(counts, index=column.cat.categories)
+    return dist[dist > 0].sort_values(ascending=False, kind='stable')
+
+# Distinct orders in a categorical Order ID column (optionally only the rows
+# selected by mask), counted by marking its integer codes in a seen-array
+def count_orders(order_ids, mask=None):
+    codes = order_ids.cat.codes.to_numpy()
+    if mask is not None:
+        codes = codes[mask]
+    seen = np.zeros(len(order_ids.cat.categories), dtype=bool)
+    seen[codes[codes >= 0]] = True
+    return np.count_nonzero(seen)
+
+# Largest n entries of an aggregated Series, biggest first with ties in index
+# order: np.argpartition finds the n-th largest value in linear time, so only
+# the entries at or above it get sorted
+def top_n(values, n=10):
+    arr = values.to_numpy()
+    candidates = np.arange(len(arr))
+    if len(arr) > n:
+        cutoff = arr[np.argpartition(arr, len(arr) - n)[len(arr) - n]]
+        candidates = np.flatnonzero(arr >= cutoff)
+    return values.iloc[candidates[np.argsort(-arr[candidates], kind='stable')[:n]]]
+
+# Sales and distinct orders per day from date-sorted rows, sharing one set of
+# day boundaries: Amount is summed over each day's block as is, and distinct
+# orders are counted by sorting codes within each day and flagging the first
+# row of each known code
+def daily_totals(dates, amount, order_ids):
+    dates = dates.to_numpy()
+    amount = amount.to_numpy()
+    codes = order_ids.cat.codes.to_numpy()
+    if len(codes) == 0:
+        return pd.DataFrame({'Date': dates, 'Amount': amount, 'Order ID': codes.astype(np.int64)})
+
+    new_day = np.r_[True, dates[1:] != dates[:-1]]
+    day_starts = np.flatnonzero(new_day)
+    codes = codes[np.lexsort((codes, np.cumsum(new_day)))]
+    first_code = (new_day | np.r_[True, codes[1:] != codes[:-1]]) & (codes >= 0)
+    return pd.DataFrame({
+        'Date': dates[day_starts],
+        'Amount': np.add.reduceat(np.nan_to_num(amount), day_starts).round(2),
+        'Order ID': np.add.reduceat(first_code.astype(np.int64), day_starts)
+    })
+
+# Section aggregations, cached per (date range, category, region) filter tuple
+@st.cache_data(max_entries=32, ttl=3600)
+def sales_metrics(filters):
+    filtered_df = get_filtered(filters)
+    total_sales = filtered_df['Amount'].sum()
+    total_orders = count_orders(filtered_df['Order ID'])
+    total_units = filtered_df['Qty'].sum()
+    category_sales = filtered_df.groupby('Category', sort=False, observed=True)['Amount'].sum()
+    # Restore category order on the small result so pie colours stay stable
+    category_sales = category_sales.sort_index().reset_index()
+    return total_sales, total_orders, total_units, category_sales
+
+@st.cache_data(max_entries=32, ttl=3600)
+def fulfillment_metrics(filters):
+    filtered_df = get_filtered(filters)
+    status_dist = category_counts(filtered_df['Status'])
+    fulfillment_dist = category_counts(filtered_df['fulfilled-by'])
+    shipping_dist = category_counts(filtered_df['ship-service-level'])
+    return status_dist, fulfillment_dist, shipping_dist
+
+@st.cache_data(max_entries=32, ttl=3600)
+def geographic_metrics(filters):
+    filtered_df = get_filtered(filters)
+
+    # Sales by State
+    state_sales = filtered_df.groupby('ship-state', sort=False, observed=True)['Amount'].sum()
+    state_sales = top_n(state_sales).reset_index()
+
+    # Orders by City
+    city_orders = filtered_df.groupby('ship-city', sort=False, observed=True).size()
+    # Break count ties by city name so the top 10 does not depend on group order
+    city_orders = top_n(city_orders.sort_index()).reset_index(name='count')
+
+    return state_sales, city_orders
+
+@st.cache_data(max_entries=32, ttl=3600)
+def customer_metrics(filters):
+    filtered_df = get_filtered(filters)
+    b2b_split = filtered_df['B2B'].value_counts()
+    
+    # Bin order sizes server-side; Qty is a small non-negative integer
+    qty_counts = np.bincount(filtered_df['Qty'].clip(lower=0).to_numpy())
+    return b2b_split, qty_counts
+
+@st.cache_data(max_entries=32, ttl=3600)
+def operational_metrics(filters):
+    filtered_df = get_filtered(filters)
+    cancelled = count_orders(filtered_df['Order ID'], (filtered_df['Status'] == 'Cancelled').to_numpy())
+    promotion_usage = count_orders(filtered_df['Order ID'], (filtered_df['promotion-ids'] != 'No Promotion').to_numpy())
+    avg_qty_per_order = filtered_df['Qty'].mean()
+    return cancelled, promotion_usage, avg_qty_per_order
+
+@st.cache_data(max_entries=32, ttl=3600)
+def trend_metrics(filters):
+    filtered_df = get_filtered(filters)
+    daily = daily_totals(filtered_df['Date'], filtered_df['Amount'], filtered_df['Order ID'])
+
+    # Create monthly sales dataframe by rolling the date-sorted daily totals up
+    # to calendar months in one reduction
+    months = daily['Date'].to_numpy().astype('datetime64[M]')
+    new_month = np.ones(len(months), dtype=bool)
+    new_month[1:] = months[1:] != months[:-1]
+    month_starts = np.flatnonzero(new_month)
+    monthly_amount = np.add.reduceat(daily['Amount'].to_numpy(), month_starts).round(2)
+
+    # Calculate MoM growth rate on the monthly array (same as pct_change)
+    mom_growth = np.full(len(monthly_amount), np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mom_growth[1:] = (monthly_amount[1:] / monthly_amount[:-1] - 1) * 100
+
+    monthly_sales_df = pd.DataFrame({
+        'Date': np.datetime_as_string(months[month_starts], unit='M'),
+        'Amount': monthly_amount,
+        'MoM Growth Rate': mom_growth
+    })
+
+    # Long ranges are plotted as weekly totals so the line charts stay light
+    trend_period = 'Daily'
+    if len(daily) > max_trend_points:
+        daily = daily.resample('W', on='Date').sum().reset_index()
+        daily['Amount'] = daily['Amount'].round(2)
+        trend_period = 'Weekly'
+    daily_sales = daily[['Date', 'Amount']]
+    daily_orders = daily[['Date', 'Order ID']]
+
+    return daily_sales, daily_orders, monthly_sales_df, trend_period
+
+# Mean of the trailing 7-row rolling mean for each group of rows in one pass.
+# Rows must be sorted by group; group g spans starts[g]:starts[g + 1].
+@njit(cache=True)
+def rolling_mean_mean(starts, qty, amount, orders, window=7):
+    n_groups = len(starts) - 1
+    out_qty = np.full(n_groups, np.nan)
+    out_amount = np.full(n_groups, np.nan)
+    out_orders = np.full(n_groups, np.nan)
+    for g in range(n_groups):
+        lo, hi = starts[g], starts[g + 1]
+        if hi == lo:
+            continue
+        sum_qty = sum_amount = sum_orders = 0.0
+        total_qty = total_amount = total_orders = 0.0
+        for i in range(lo, hi):
+            sum_qty += qty[i]
+            sum_amount += amount[i]
+            sum_orders += orders[i]
+            if i - lo >= window:
+                sum_qty -= qty[i - window]
+                sum_amount -= amount[i - window]
+                sum_orders -= orders[i - window]
+            n = min(i - lo + 1, window)
+            total_qty += sum_qty / n
+            total_amount += sum_amount / n
+            total_orders += sum_orders / n
+        out_qty[g] = total_qty / (hi - lo)
+        out_amount[g] = total_amount / (hi - lo)
+        out_orders[g] = total_orders / (hi - lo)
+    return out_qty, out_amount, out_orders
+
+# Composite 0-100 velocity score: 40% units, 40% revenue, 20% orders, each
+# normalised by its maximum across categories
+@njit(cache=True)
+def velocity_score(qty, amount, orders):
+    if len(qty) == 0:
+        return np.empty(0)
+    return (qty / qty.max() * 0.4 + amount / amount.max() * 0.4 + orders / orders.max() * 0.2) * 100
+
+@st.cache_data(max_entries=32, ttl=3600)
+def velocity_metrics(filters):
+    filtered_df = get_filtered(filters)
+
+    # Daily sales per category without a pandas groupby: sort rows by
+    # (category, date, order) and reduce over each (category, day) block
+    categories = filtered_df['Category'].cat.categories
+    cat_codes = filtered_df['Category'].cat.codes.to_numpy()
+    known = cat_codes >= 0
+    cat_codes = cat_codes[known]
+    dates = filtered_df['Date'].to_numpy()[known]
+    order_codes = filtered_df['Order ID'].cat.codes.to_numpy()[known]
+    order = np.lexsort((order_codes, dates, cat_codes))
+    cat_codes, dates, order_codes = cat_codes[order], dates[order], order_codes[order]
+    new_day = np.ones(len(cat_codes), dtype=bool)
+    new_day[1:] = (cat_codes[1:] != cat_codes[:-1]) | (dates[1:] != dates[:-1])
+    day_starts = np.flatnonzero(new_day)
+    first_order = new_day.copy()
+    first_order[1:] |= order_codes[1:] != order_codes[:-1]
+    first_order &= order_codes >= 0
+    qty = filtered_df['Qty'].to_numpy(dtype=np.float64)[known][order]
+    amount = np.nan_to_num(filtered_df['Amount'].to_numpy()[known][order])
+
+    # Calculate rolling 7-day average for smoother trends, averaged per category
+    starts = np.searchsorted(cat_codes[day_starts], np.arange(len(categories) + 1))
+    avg_qty, avg_amount, avg_orders = rolling_mean_mean(
+        starts,
+        np.add.reduceat(qty, day_starts),
+        np.add.reduceat(amount, day_starts).round(2),
+        np.add.reduceat(first_order.astype(np.float64), day_starts)
+    )
+    observed = np.diff(starts) > 0
+    avg_qty, avg_amount, avg_orders = avg_qty[observed], avg_amount[observed], avg_orders[observed]
+    category_velocity = pd.DataFrame({
+        'Category': categories[observed],
+        'Qty': avg_qty,          # Average daily units sold
+        'Amount': avg_amount,    # Average daily revenue
+        'Order ID': avg_orders,  # Average daily orders
+        # Calculate velocity score (normalized composite score)
+        'Velocity Score': velocity_score(avg_qty, avg_amount, avg_orders)
+    })
+
+    # Sort by velocity score
+    return category_velocity.sort_values('Velocity Score', ascending=False)
+
+@st.cache_data(max_entries=32, ttl=3600)
+def promotion_metrics(filters):
+    filtered_df = get_filtered(filters)
+
+    # Group by promotion ID
+    promo_analysis = filtered_df.groupby('promotion-ids', sort=False, observed=True).agg({
+        'Order ID': 'nunique',  # Number of orders
+        'Amount': 'sum',        # Total revenue
+        'Qty': 'sum'           # Total units sold
+    }).reset_index()
+
+    # Calculate average order value for each promotion
+    promo_analysis['Avg Order Value'] = promo_analysis['Amount'] / promo_analysis['Order ID']
+
+    # Calculate average units per order
+    promo_analysis['Avg Units per Order'] = promo_analysis['Qty'] / promo_analysis['Order ID']
+
+    # Sort by revenue
+    return promo_analysis.sort_values('Amount', ascending=False)
+
+# Sidebar date bounds and selectbox options, computed once per loaded dataset
+@st.cache_data
+def sidebar_options():
+    df = load_data()
+    categories = ['All'] + list(df['Category'].unique())
+    regions = ['All'] + list(df['ship-state'].unique())
+    return df['Date'].min(), df['Date'].max(), categories, regions
+
+# Add custom CSS for consistent styling. It is emitted before loading the data so
+# error states are styled too, and on every run because Streamlit drops any
+# element a rerun does not emit again
+st.markdown("""
+    <style>
+    /* Main content and background styling */
+    .main {
+        background-color: #36393f;
+        color: #ffffff;
+    }
+    
+    /* Sidebar styling */
+    .css-1d391kg {
+        background-color: #2f3136;
+    }
+    
+    /* Metric containers */
+    div[data-testid="stMetric"] {
+        background-color: #2c2f33;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        border: 1px solid #40444b;
+    }
+    
+    /* Metric labels */
+    div[data-testid="stMetricLabel"] {
+        font-size: 1rem;
+        color: #dcddde;
+    }
+    
+    /* Metric values */
+    div[data-testid="stMetricValue"] {
+        color: #7289da;
+    }
+    
+    /* Section headers */
+    h1, h2, h3 {
+        color: #ffffff;
+        font-weight: 600;
+        padding-top: 1rem;
+    }
+    
+    /* Chart containers */
+    div[data-testid="stPlotlyChart"] > div {
+        background-color: #2c2f33;
+        border-radius: 0.5rem;
+        border: 1px solid #40444b;
+        padding: 1rem;
+    }
+    
+    /* DataFrame styling */
+    .dataframe {
+        background-color: #2c2f33;
+        color: #ffffff;
+    }
+    
+    /* Text and markdown */
+    .markdown-text-container {
+        color: #dcddde;
+        font-size: 0.9rem;
+        font-style: italic;
+    }
+    
+    /* Streamlit base elements */
+    .stTextInput > div > div > input {
+        background-color: #40444b;
+        color: #ffffff;
+    }
+    
+    .stSelectBox > div > div > select {
+        background-color: #40444b;
+        color: #ffffff;
+    }
+    
+    /* Links */
+    a {
+        color: #00b0f4;
+    }
+    
+    /* Sidebar text */
+    .css-pkbazv {
+        color: #ffffff;
+    }
+    
+    /* Make sure text inputs and selectors are visible */
+    .stDateInput, .stSelectbox {
+        background-color: #40444b;
+        color: #ffffff;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
 # Load the data
 try:
-    df = load_data()
+    min_date, max_date, categories, regions = sidebar_options()
     
     # Sidebar filters
     st.sidebar.header('Filters')
@@ -114,37 +635,28 @@ try:
     # Date range filter
     date_range = st.sidebar.date_input(
         "Select Date Range",
-        [df['Date'].min(), df['Date'].max()]
+        [min_date, max_date]
     )
     
     # Category filter
-    categories = ['All'] + list(df['Category'].unique())
     selected_category = st.sidebar.selectbox('Select Category', categories)
     
     # Region filter
-    regions = ['All'] + list(df['ship-state'].unique())
     selected_region = st.sidebar.selectbox('Select Region', regions)
     
-    # Apply filters
-    mask = (df['Date'].dt.date >= date_range[0]) & (df['Date'].dt.date <= date_range[1])
-    filtered_df = df[mask]
-    
-    if selected_category != 'All':
-        filtered_df = filtered_df[filtered_df['Category'] == selected_category]
-    if selected_region != 'All':
-        filtered_df = filtered_df[filtered_df['ship-state'] == selected_region]
+    # Filter key shared by all cached section aggregations
+    filters = (tuple(date_range), selected_category, selected_region)
     
     # 1. Sales Performance Metrics
     st.header('Sales Performance')
     st.markdown("*Key metrics showing overall sales performance, orders, and product category analysis*")
+    total_sales, total_orders, total_units, category_sales = sales_metrics(filters)
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        total_sales = filtered_df['Amount'].sum()
         st.metric("Total Sales", f"${total_sales:,.2f}")
     
     with col2:
-        total_orders = filtered_df['Order ID'].nunique()
         st.metric("Number of Orders", f"{total_orders:,}")
     
     with col3:
@@ -152,186 +664,158 @@ try:
         st.metric("Average Order Value", f"${aov:,.2f}")
     
     with col4:
-        total_units = filtered_df['Qty'].sum()
         st.metric("Total Units Sold", f"{total_units:,}")
     
     # Revenue by Category
     st.subheader('Revenue by Product Category')
-    category_sales = filtered_df.groupby('Category')['Amount'].sum().reset_index()
-    fig_category = px.bar(
-        category_sales,
-        x='Category',
-        y='Amount',
-        title='Sales by Category',
-        template=plotly_template,
-        color_discrete_sequence=custom_colors
+    fig_category = bar_chart(
+        category_sales['Category'],
+        category_sales['Amount'],
+        'Sales by Category',
+        'Category',
+        'Amount'
     )
     st.plotly_chart(fig_category, use_container_width=True)
 
     # 2. Fulfillment Metrics
     st.header('Fulfillment Metrics')
     st.markdown("*Analysis of order status, fulfillment methods, and shipping service preferences*")
+    status_dist, fulfillment_dist, shipping_dist = fulfillment_metrics(filters)
     col1, col2 = st.columns(2)
     
     with col1:
         # Order Status Breakdown
-        status_dist = filtered_df['Status'].value_counts()
-        fig_status = px.pie(
-            values=status_dist.values,
-            names=status_dist.index,
-            title='Order Status Distribution',
-            template=plotly_template,
-            color_discrete_sequence=custom_colors
+        fig_status = pie_chart(
+            status_dist.index,
+            status_dist.values,
+            'Order Status Distribution'
         )
         st.plotly_chart(fig_status)
     
     with col2:
         # Fulfillment Method Distribution
-        fulfillment_dist = filtered_df['fulfilled-by'].value_counts()
-        fig_fulfillment = px.pie(
-            values=fulfillment_dist.values,
-            names=fulfillment_dist.index,
-            title='Fulfillment Method Distribution',
-            template=plotly_template,
-            color_discrete_sequence=custom_colors
+        fig_fulfillment = pie_chart(
+            fulfillment_dist.index,
+            fulfillment_dist.values,
+            'Fulfillment Method Distribution'
         )
         st.plotly_chart(fig_fulfillment)
 
     # Shipping Service Level
-    shipping_dist = filtered_df['ship-service-level'].value_counts()
-    fig_shipping = px.bar(
-        x=shipping_dist.index,
-        y=shipping_dist.values,
-        title='Shipping Service Level Usage',
-        template=plotly_template,
-        color_discrete_sequence=custom_colors
+    fig_shipping = bar_chart(
+        shipping_dist.index,
+        shipping_dist.values,
+        'Shipping Service Level Usage',
+        'x',
+        'y'
     )
     st.plotly_chart(fig_shipping, use_container_width=True)
 
     # 3. Geographic Metrics
     st.header('Geographic Metrics')
     st.markdown("*Distribution of sales and orders across different states and cities*")
+    state_sales, city_orders = geographic_metrics(filters)
     
     # Sales by State
-    state_sales = filtered_df.groupby('ship-state')['Amount'].sum().reset_index()
-    state_sales = state_sales.sort_values('Amount', ascending=False)
-    
-    fig_state = px.bar(
-        state_sales.head(10),
-        x='ship-state',
-        y='Amount',
-        title='Top 10 States by Sales',
-        template=plotly_template,
-        color_discrete_sequence=custom_colors
+    fig_state = bar_chart(
+        state_sales['ship-state'],
+        state_sales['Amount'],
+        'Top 10 States by Sales',
+        'ship-state',
+        'Amount'
     )
     st.plotly_chart(fig_state, use_container_width=True)
 
     # Top Cities
-    city_orders = filtered_df.groupby('ship-city').size().reset_index(name='count')
-    city_orders = city_orders.sort_values('count', ascending=False)
-    
-    fig_city = px.bar(
-        city_orders.head(10),
-        x='ship-city',
-        y='count',
-        title='Top 10 Cities by Number of Orders',
-        template=plotly_template,
-        color_discrete_sequence=custom_colors
+    fig_city = bar_chart(
+        city_orders['ship-city'],
+        city_orders['count'],
+        'Top 10 Cities by Number of Orders',
+        'ship-city',
+        'count'
     )
     st.plotly_chart(fig_city, use_container_width=True)
 
     # 4. Customer Insights
     st.header('Customer Insights')
     st.markdown("*Understanding customer segments and ordering patterns through B2B/B2C split and order sizes*")
+    b2b_split, qty_counts = customer_metrics(filters)
     col1, col2 = st.columns(2)
     
     with col1:
         # B2B vs B2C Split
-        b2b_split = filtered_df['B2B'].value_counts()
-        fig_b2b = px.pie(
-            values=b2b_split.values,
-            names=b2b_split.index,
-            title='B2B vs B2C Orders',
-            template=plotly_template,
-            color_discrete_sequence=custom_colors
+        fig_b2b = pie_chart(
+            b2b_split.index,
+            b2b_split.values,
+            'B2B vs B2C Orders'
         )
         st.plotly_chart(fig_b2b)
     
     with col2:
         # Order Size Distribution
-        fig_order_size = px.histogram(
-            filtered_df,
-            x='Qty',
-            title='Order Size Distribution',
-            template=plotly_template,
-            color_discrete_sequence=custom_colors
+        # Pre-binned counts, so only one bar per quantity is sent to the browser
+        fig_order_size = bar_chart(
+            np.arange(len(qty_counts)),
+            qty_counts,
+            'Order Size Distribution',
+            'Qty',
+            'count'
         )
         st.plotly_chart(fig_order_size)
 
     # 5. Operational Efficiency
     st.header('Operational Efficiency')
     st.markdown("*Key performance indicators for business operations including cancellations and promotions*")
+    cancelled, promotion_usage, avg_qty_per_order = operational_metrics(filters)
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        cancelled = filtered_df[filtered_df['Status'] == 'Cancelled']['Order ID'].nunique()
         cancellation_rate = (cancelled / total_orders) * 100
         st.metric("Cancellation Rate", f"{cancellation_rate:.2f}%")
     
     with col2:
-        promotion_usage = filtered_df[filtered_df['promotion-ids'] != 'No Promotion']['Order ID'].nunique()
         promotion_rate = (promotion_usage / total_orders) * 100
         st.metric("Promotion Usage Rate", f"{promotion_rate:.2f}%")
     
     with col3:
-        avg_qty_per_order = filtered_df['Qty'].mean()
         st.metric("Avg Units Per Order", f"{avg_qty_per_order:.2f}")
 
     # 6. Trends Over Time
     st.header('Trends Over Time')
     st.markdown("*Historical analysis of daily sales and order volume patterns*")
+    daily_sales, daily_orders, monthly_sales_df, trend_period = trend_metrics(filters)
     
-    # Daily sales trend
-    daily_sales = filtered_df.groupby('Date')['Amount'].sum().reset_index()
-    fig_trend = px.line(
-        daily_sales,
-        x='Date',
-        y='Amount',
-        title='Daily Sales Trend',
-        template=plotly_template,
-        color_discrete_sequence=custom_colors
+    # Daily sales trend (weekly on long ranges)
+    fig_trend = line_chart(
+        daily_sales['Date'],
+        daily_sales['Amount'],
+        f'{trend_period} Sales Trend',
+        'Date',
+        'Amount',
+        uirevision='trend'
     )
     st.plotly_chart(fig_trend, use_container_width=True)
 
     # Order volume trend
-    daily_orders = filtered_df.groupby('Date')['Order ID'].nunique().reset_index()
-    fig_orders = px.line(
-        daily_orders,
-        x='Date',
-        y='Order ID',
-        title='Daily Order Volume',
-        template=plotly_template,
-        color_discrete_sequence=custom_colors
+    fig_orders = line_chart(
+        daily_orders['Date'],
+        daily_orders['Order ID'],
+        f'{trend_period} Order Volume',
+        'Date',
+        'Order ID',
+        uirevision='orders'
     )
     st.plotly_chart(fig_orders, use_container_width=True)
 
     # Month-over-Month Growth Analysis
-    # Create monthly sales dataframe
-    monthly_sales = filtered_df.groupby(filtered_df['Date'].dt.to_period('M'))['Amount'].sum()
-    monthly_sales_df = pd.DataFrame(monthly_sales).reset_index()
-    monthly_sales_df['Date'] = monthly_sales_df['Date'].astype(str)
-    
-    # Calculate MoM growth rate
-    monthly_sales_df['MoM Growth Rate'] = monthly_sales_df['Amount'].pct_change() * 100
-    
     # Create a figure with dual y-axes
     fig_mom = go.Figure()
     
     # Add monthly sales bars
     fig_mom.add_trace(
         go.Bar(
-            x=monthly_sales_df['Date'],
-            y=monthly_sales_df['Amount'],
+            x=monthly_sales_df['Date'].to_numpy(),
+            y=monthly_sales_df['Amount'].to_numpy(),
             name='Monthly Sales',
             yaxis='y'
         )
@@ -340,8 +824,8 @@ try:
     # Add MoM growth rate line
     fig_mom.add_trace(
         go.Scatter(
-            x=monthly_sales_df['Date'],
-            y=monthly_sales_df['MoM Growth Rate'],
+            x=monthly_sales_df['Date'].to_numpy(),
+            y=monthly_sales_df['MoM Growth Rate'].to_numpy(),
             name='MoM Growth Rate (%)',
             yaxis='y2',
             line=dict(color='red')
@@ -362,7 +846,8 @@ try:
         template=plotly_template,
         plot_bgcolor='rgba(0, 0, 0, 0)',
         paper_bgcolor='rgba(0, 0, 0, 0)',
-        font={'color': '#2c3e50'}
+        font={'color': '#2c3e50'},
+        uirevision='mom'
     )
     
     st.plotly_chart(fig_mom, use_container_width=True)
@@ -380,7 +865,7 @@ try:
         )
     
     with col2:
-        highest_month = monthly_sales_df.loc[monthly_sales_df['Amount'].idxmax()]
+        highest_month = monthly_sales_df.iloc[np.nanargmax(monthly_sales_df['Amount'].to_numpy())]
         st.metric(
             "Best Performing Month",
             f"${highest_month['Amount']:,.2f}",
@@ -391,68 +876,43 @@ try:
     st.header('Sales Velocity Analysis')
     st.markdown("*Analysis of sales speed and product movement patterns across categories*")
 
-    # Calculate daily sales velocity metrics
-    velocity_df = filtered_df.copy()
-    
-    # Group by date and category to get daily sales per category
-    daily_category_sales = velocity_df.groupby(['Date', 'Category']).agg({
-        'Qty': 'sum',
-        'Amount': 'sum',
-        'Order ID': 'nunique'
-    }).reset_index()
-
-    # Calculate rolling 7-day average for smoother trends
-    category_velocity = daily_category_sales.groupby('Category').agg({
-        'Qty': lambda x: x.rolling(7, min_periods=1).mean().mean(),  # Average daily units sold
-        'Amount': lambda x: x.rolling(7, min_periods=1).mean().mean(),  # Average daily revenue
-        'Order ID': lambda x: x.rolling(7, min_periods=1).mean().mean()  # Average daily orders
-    }).reset_index()
-
-    # Calculate velocity score (normalized composite score)
-    category_velocity['Velocity Score'] = (
-        (category_velocity['Qty'] / category_velocity['Qty'].max()) * 0.4 +
-        (category_velocity['Amount'] / category_velocity['Amount'].max()) * 0.4 +
-        (category_velocity['Order ID'] / category_velocity['Order ID'].max()) * 0.2
-    ) * 100
-
-    # Sort by velocity score
-    category_velocity = category_velocity.sort_values('Velocity Score', ascending=False)
+    category_velocity = velocity_metrics(filters)
 
     # Display velocity metrics
     col1, col2 = st.columns(2)
 
     with col1:
         # Velocity score by category
-        fig_velocity = px.bar(
-            category_velocity,
-            x='Category',
-            y='Velocity Score',
-            title='Product Category Velocity Scores',
-            labels={'Velocity Score': 'Velocity Score (0-100)'},
-            template=plotly_template,
-            color_discrete_sequence=custom_colors
+        fig_velocity = bar_chart(
+            category_velocity['Category'],
+            category_velocity['Velocity Score'],
+            'Product Category Velocity Scores',
+            'Category',
+            'Velocity Score (0-100)',
+            color='lightseagreen'
         )
-        fig_velocity.update_traces(marker_color='lightseagreen')
         st.plotly_chart(fig_velocity, use_container_width=True)
 
     with col2:
         # Daily units movement by category
-        fig_units = px.bar(
-            category_velocity,
-            x='Category',
-            y='Qty',
-            title='Average Daily Units Sold by Category',
-            labels={'Qty': 'Units per Day'},
-            template=plotly_template,
-            color_discrete_sequence=custom_colors
+        fig_units = bar_chart(
+            category_velocity['Category'],
+            category_velocity['Qty'],
+            'Average Daily Units Sold by Category',
+            'Category',
+            'Units per Day',
+            color='coral'
         )
-        fig_units.update_traces(marker_color='coral')
         st.plotly_chart(fig_units, use_container_width=True)
 
     # Display top performing categories
     st.subheader("Category Performance Insights")
     col1, col2, col3 = st.columns(3)
 
+    # Positional argmax on the underlying arrays (rows are already sorted by score)
+    top_units = category_velocity.iloc[np.nanargmax(category_velocity['Qty'].to_numpy())]
+    top_revenue = category_velocity.iloc[np.nanargmax(category_velocity['Amount'].to_numpy())]
+
     with col1:
         top_velocity = category_velocity.iloc[0]
         st.metric(
@@ -462,7 +922,6 @@ try:
         )
 
     with col2:
-        top_units = category_velocity.loc[category_velocity['Qty'].idxmax()]
         st.metric(
             "Highest Volume Category",
             top_units['Category'],
@@ -470,7 +929,6 @@ try:
         )
 
     with col3:
-        top_revenue = category_velocity.loc[category_velocity['Amount'].idxmax()]
         st.metric(
             "Highest Revenue Category",
             top_revenue['Category'],
@@ -481,81 +939,61 @@ try:
     st.subheader("Detailed Velocity Metrics")
     st.markdown("*Click on columns to sort by different metrics*")
     
-    # Format the detailed metrics table
-    detailed_velocity = category_velocity.copy()
-    detailed_velocity['Qty'] = detailed_velocity['Qty'].round(1)
-    detailed_velocity['Amount'] = detailed_velocity['Amount'].round(2)
-    detailed_velocity['Order ID'] = detailed_velocity['Order ID'].round(1)
-    detailed_velocity['Velocity Score'] = detailed_velocity['Velocity Score'].round(1)
-    
-    # Rename columns for better readability
-    detailed_velocity.columns = ['Category', 'Avg Daily Units', 'Avg Daily Revenue', 
-                               'Avg Daily Orders', 'Velocity Score']
-    
+    # Label and round columns at display time instead of copying the table
     st.dataframe(
-        detailed_velocity,
+        category_velocity,
         hide_index=True,
-        use_container_width=True
+        use_container_width=True,
+        column_config={
+            'Qty': st.column_config.NumberColumn('Avg Daily Units', format='%.1f'),
+            'Amount': st.column_config.NumberColumn('Avg Daily Revenue', format='%.2f'),
+            'Order ID': st.column_config.NumberColumn('Avg Daily Orders', format='%.1f'),
+            'Velocity Score': st.column_config.NumberColumn('Velocity Score', format='%.1f')
+        }
     )
 
     # 8. Promotion Analysis
     st.header('Promotion Analysis')
     st.markdown("*Analysis of promotional campaign effectiveness and impact on sales*")
 
-    # Create promotion analysis dataframe
-    promo_df = filtered_df.copy()
-    
-    # Group by promotion ID
-    promo_analysis = promo_df.groupby('promotion-ids').agg({
-        'Order ID': 'nunique',  # Number of orders
-        'Amount': 'sum',        # Total revenue
-        'Qty': 'sum'           # Total units sold
-    }).reset_index()
-    
-    # Calculate average order value for each promotion
-    promo_analysis['Avg Order Value'] = promo_analysis['Amount'] / promo_analysis['Order ID']
-    
-    # Calculate average units per order
-    promo_analysis['Avg Units per Order'] = promo_analysis['Qty'] / promo_analysis['Order ID']
-    
-    # Sort by revenue
-    promo_analysis = promo_analysis.sort_values('Amount', ascending=False)
+    promo_analysis = promotion_metrics(filters)
+    top_promos = promo_analysis.head(10)
 
     # Display promotion metrics
     col1, col2 = st.columns(2)
 
     with col1:
         # Top promotions by revenue
-        fig_promo_rev = px.bar(
-            promo_analysis.head(10),
-            x='promotion-ids',
-            y='Amount',
-            title='Top 10 Promotions by Revenue',
-            labels={'promotion-ids': 'Promotion ID', 'Amount': 'Revenue ($)'},
-            template=plotly_template,
-            color_discrete_sequence=custom_colors
+        fig_promo_rev = bar_chart(
+            top_promos['promotion-ids'],
+            top_promos['Amount'],
+            'Top 10 Promotions by Revenue',
+            'Promotion ID',
+            'Revenue ($)',
+            color='teal'
         )
-        fig_promo_rev.update_traces(marker_color='teal')
         st.plotly_chart(fig_promo_rev, use_container_width=True)
 
     with col2:
         # Average order value by promotion
-        fig_promo_aov = px.bar(
-            promo_analysis.head(10),
-            x='promotion-ids',
-            y='Avg Order Value',
-            title='Average Order Value by Promotion',
-            labels={'promotion-ids': 'Promotion ID', 'Avg Order Value': 'AOV ($)'},
-            template=plotly_template,
-            color_discrete_sequence=custom_colors
+        fig_promo_aov = bar_chart(
+            top_promos['promotion-ids'],
+            top_promos['Avg Order Value'],
+            'Average Order Value by Promotion',
+            'Promotion ID',
+            'AOV ($)',
+            color='coral'
         )
-        fig_promo_aov.update_traces(marker_color='coral')
         st.plotly_chart(fig_promo_aov, use_container_width=True)
 
     # Promotion performance metrics
     st.subheader("Promotion Performance Summary")
     col1, col2, col3 = st.columns(3)
 
+    # Positional argmax on the underlying arrays (rows are already sorted by revenue)
+    highest_aov = promo_analysis.iloc[np.nanargmax(promo_analysis['Avg Order Value'].to_numpy())]
+    highest_units = promo_analysis.iloc[np.nanargmax(promo_analysis['Avg Units per Order'].to_numpy())]
+
     with col1:
         top_promo = promo_analysis.iloc[0]
         st.metric(
@@ -565,7 +1003,6 @@ try:
         )
 
     with col2:
-        highest_aov = promo_analysis.loc[promo_analysis['Avg Order Value'].idxmax()]
         st.metric(
             "Highest AOV Promotion",
             highest_aov['promotion-ids'],
@@ -573,7 +1010,6 @@ try:
         )
 
     with col3:
-        highest_units = promo_analysis.loc[promo_analysis['Avg Units per Order'].idxmax()]
         st.metric(
             "Highest Units/Order Promotion",
             highest_units['promotion-ids'],
@@ -584,111 +1020,20 @@ try:
     st.subheader("Detailed Promotion Metrics")
     st.markdown("*Click on columns to sort by different metrics*")
     
-    # Format the detailed metrics table
-    detailed_promos = promo_analysis.copy()
-    detailed_promos['Amount'] = detailed_promos['Amount'].round(2)
-    detailed_promos['Avg Order Value'] = detailed_promos['Avg Order Value'].round(2)
-    detailed_promos['Avg Units per Order'] = detailed_promos['Avg Units per Order'].round(1)
-    
-    # Rename columns for better readability
-    detailed_promos.columns = ['Promotion ID', 'Number of Orders', 'Total Revenue', 
-                             'Total Units', 'Avg Order Value', 'Avg Units per Order']
-    
+    # Label and round columns at display time instead of copying the table
     st.dataframe(
-        detailed_promos,
+        promo_analysis,
         hide_index=True,
-        use_container_width=True
-    )
-
-    # Add custom CSS for consistent styling
-    st.markdown("""
-        <style>
-        /* Main content and background styling */
-        .main {
-            background-color: #36393f;
-            color: #ffffff;
-        }
-        
-        /* Sidebar styling */
-        .css-1d391kg {
-            background-color: #2f3136;
-        }
-        
-        /* Metric containers */
-        div[data-testid="stMetric"] {
-            background-color: #2c2f33;
-            padding: 1rem;
-            border-radius: 0.5rem;
-            border: 1px solid #40444b;
-        }
-        
-        /* Metric labels */
-        div[data-testid="stMetricLabel"] {
-            font-size: 1rem;
-            color: #dcddde;
-        }
-        
-        /* Metric values */
-        div[data-testid="stMetricValue"] {
-            color: #7289da;
-        }
-        
-        /* Section headers */
-        h1, h2, h3 {
-            color: #ffffff;
-            font-weight: 600;
-            padding-top: 1rem;
-        }
-        
-        /* Chart containers */
-        div[data-testid="stPlotlyChart"] > div {
-            background-color: #2c2f33;
-            border-radius: 0.5rem;
-            border: 1px solid #40444b;
-            padding: 1rem;
-        }
-        
-        /* DataFrame styling */
-        .dataframe {
-            background-color: #2c2f33;
-            color: #ffffff;
-        }
-        
-        /* Text and markdown */
-        .markdown-text-container {
-            color: #dcddde;
-            font-size: 0.9rem;
-            font-style: italic;
+        use_container_width=True,
+        column_config={
+            'promotion-ids': 'Promotion ID',
+            'Order ID': 'Number of Orders',
+            'Amount': st.column_config.NumberColumn('Total Revenue', format='%.2f'),
+            'Qty': 'Total Units',
+            'Avg Order Value': st.column_config.NumberColumn('Avg Order Value', format='%.2f'),
+            'Avg Units per Order': st.column_config.NumberColumn('Avg Units per Order', format='%.1f')
         }
-        
-        /* Streamlit base elements */
-        .stTextInput > div > div > input {
-            background-color: #40444b;
-            color: #ffffff;
-        }
-        
-        .stSelectBox > div > div > select {
-            background-color: #40444b;
-            color: #ffffff;
-        }
-        
-        /* Links */
-        a {
-            color: #00b0f4;
-        }
-        
-        /* Sidebar text */
-        .css-pkbazv {
-            color: #ffffff;
-        }
-        
-        /* Make sure text inputs and selectors are visible */
-        .stDateInput, .stSelectbox {
-            background-color: #40444b;
-            color: #ffffff;
-        }
-        </style>
-        """, unsafe_allow_html=True)
+    )
 
 except Exception as e:
     st.error(f"Error loading data: {str(e)}")